@@ -0,0 +1,34 @@
+"""Python toolkit for the Global Green Bond Tracker.
+
+Complements the R preprocessing notebooks in ``scripts/`` with a
+pandas-based loading, validation, and analytics layer, plus a small
+command line interface (``greenbond`` / ``gbt``).
+
+Submodules are imported lazily (PEP 562) so that importing the package
+— e.g. for ``__version__`` — does not pull in pandas.
+"""
+
+__version__ = "0.1.0"
+
+_LAZY = {
+    "get_summary_statistics": "data_loader",
+    "join_bonds_with_geo": "data_loader",
+    "load_country_geometries": "data_loader",
+    "load_green_bonds": "data_loader",
+    "validate_bond_data": "data_loader",
+    "ValidationResult": "validation",
+    "validate_bond_data_enhanced": "validation",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    return getattr(import_module(f".{module}", __name__), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,55 @@
+"""Thin CLI entry point.
+
+Handles ``--help`` and version requests with plain ``print`` before
+anything heavy (rich, pandas, the package itself) is imported; only real
+subcommands fall through to the argparse dispatcher in :mod:`.cli`.
+"""
+
+import sys
+
+_USAGE = """\
+Usage: gbt [OPTIONS] COMMAND [ARGS]...
+
+  Load, validate, and summarize the Global Green Bond Tracker data.
+
+Options:
+  -v, --version  Show the toolkit version and exit.
+  --verbose      Enable debug logging.
+  --config PATH  Alternate config.yaml location.
+  --help         Show this message and exit.
+
+Commands:
+  validate  Validate the bond CSV and report errors, warnings, and row flags.
+  summary   Print portfolio statistics and write the summary/coverage CSVs.
+  map       Join bonds onto country geometries and export the ArcGIS-ready CSV.
+  viz       Render the static charts (and optionally the interactive map).
+  all       Run validation, summary, map export, and visuals on a single load.
+  version   Show the toolkit version.
+"""
+
+
+def _version_string():
+    try:
+        from importlib.metadata import version
+
+        return f"Green Bond Tracker v{version('green-bond-tracker')}"
+    except Exception:
+        from . import __version__
+
+        return f"Green Bond Tracker v{__version__}"
+
+
+def main():
+    if len(sys.argv) <= 2 and sys.argv[-1] in ("--help", "-h"):
+        print(_USAGE, end="")
+        return
+    if len(sys.argv) == 2 and sys.argv[1] in ("version", "--version", "-v"):
+        print(_version_string())
+        return
+    from .cli import run
+
+    run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Process-level caching for the expensive data loads.
+
+Back-to-back commands in one interpreter (a test harness, a notebook,
+or future multi-command runs) otherwise re-parse the same CSV and
+GeoJSON. Results are memoized on ``(path, mtime_ns, size)`` so an
+edited file is a cache miss, never a stale hit.
+"""
+
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def _cached_bonds(path, mtime_ns, size, engine):
+    from .data_loader import load_green_bonds
+
+    return load_green_bonds(path, engine=engine)
+
+
+@lru_cache(maxsize=4)
+def _cached_geometries(path, mtime_ns, size):
+    from .data_loader import load_country_geometries
+
+    return load_country_geometries(path)
+
+
+def load_bonds_cached(path, engine="pandas"):
+    """:func:`load_green_bonds` memoized on the file's stat signature.
+
+    Returns a shallow copy so callers adding columns do not mutate the
+    cached frame; the column data itself is shared.
+    """
+    st = os.stat(path)
+    return _cached_bonds(str(path), st.st_mtime_ns, st.st_size, engine).copy(
+        deep=False
+    )
+
+
+def load_geometries_cached(path):
+    """:func:`load_country_geometries` memoized on the stat signature."""
+    st = os.stat(path)
+    return _cached_geometries(str(path), st.st_mtime_ns, st.st_size)
@@ -0,0 +1,30 @@
+"""Portfolio analytics over the green bond dataset.
+
+Metric functions are re-exported lazily (PEP 562) so importing the
+package does not pay for pandas/numpy until a metric is actually used.
+"""
+
+_METRICS = frozenset(
+    {
+        "aggregation_by_category",
+        "aggregation_by_country",
+        "aggregation_by_year",
+        "concentration_index",
+        "data_coverage_report",
+        "issuance_overview",
+        "portfolio_summary_table",
+        "top_n_concentration",
+    }
+)
+
+
+def __getattr__(name):
+    if name not in _METRICS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from . import metrics
+
+    return getattr(metrics, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | _METRICS)
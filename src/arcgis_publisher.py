@@ -0,0 +1,38 @@
+"""Placeholder for publishing processed layers to ArcGIS Online.
+
+The hosted map (see README) is currently published manually from ArcGIS
+Pro. Until the ``arcgis`` dependency and credential handling are wired
+up, every name in the planned API raises ``RuntimeError`` via a
+module-level ``__getattr__`` (PEP 562), so importing this module costs
+nothing.
+"""
+
+_NOT_AVAILABLE = (
+    "ArcGIS publishing is not available yet: install the 'arcgis' package "
+    "and configure an ArcGIS Online account, then see docs/ for the manual "
+    "publishing workflow in the meantime."
+)
+
+# Planned publisher surface; kept as names only until implemented.
+_PLANNED = frozenset(
+    {
+        "ArcGISPublisher",
+        "connect",
+        "upload_csv",
+        "upload_shapefile",
+        "publish_feature_layer",
+        "update_layer_data",
+        "set_sharing",
+        "configure_popups",
+    }
+)
+
+
+def __getattr__(name):
+    if name in _PLANNED:
+        raise RuntimeError(f"{name}: {_NOT_AVAILABLE}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _PLANNED)
@@ -0,0 +1,966 @@
+"""Command line interface for the green bond toolkit.
+
+Installed as both ``greenbond`` (legacy name) and ``gbt``.
+"""
+
+import json
+import os
+import re
+import sys
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+
+_MARKUP_RE = re.compile(r"\[/?[a-zA-Z][\w .#-]*\]")
+
+
+class _PlainConsole:
+    """print-backed Console stand-in for non-TTY / NO_COLOR output.
+
+    Strips rich markup tags so redirected output stays clean without
+    importing rich at all.
+    """
+
+    is_rich = False
+    ok = "✓"
+    err = "Error:"
+
+    def print(self, *objects, sep=" ", end="\n"):
+        text = sep.join(str(obj) for obj in objects)
+        print(_MARKUP_RE.sub("", text), end=end)
+
+
+@lru_cache(maxsize=1)
+def _get_console():
+    """Build the output console on first use; --help never pays for rich.
+
+    Piped or NO_COLOR output gets the plain shim, so rich (and its
+    markup parsing) is only loaded for interactive terminals.
+    """
+    if not sys.stdout.isatty() or os.environ.get("NO_COLOR"):
+        return _PlainConsole()
+    from rich.console import Console
+
+    # highlight=False skips rich's regex highlighter on every print;
+    # soft_wrap avoids measuring long lines for wrapping.
+    console = Console(highlight=False, soft_wrap=True)
+    console.is_rich = True
+    # Pre-parsed style tokens: rich passes Text through print() without
+    # re-running the markup parser, so the common "✓"/"Error:" prefixes
+    # are styled once here rather than on every call.
+    from rich.text import Text
+
+    console.ok = Text("✓", style="green")
+    console.err = Text("Error:", style="bold red")
+    return console
+
+
+_VERBOSE = False
+
+# Computed once at import: a fixed-prefix test on the basename instead of
+# a substring scan of the full interpreter path on every callback run.
+_INVOKED_AS_GREENBOND = bool(sys.argv) and sys.argv[0].rsplit("/", 1)[-1].startswith(
+    "greenbond"
+)
+
+
+def _print_traceback(console):
+    """Print the traceback only when debugging was asked for.
+
+    The normal error path stays a one-line message; pass --verbose or
+    set GREENBOND_DEBUG=1 to see the full traceback. traceback itself
+    is only imported when it will actually be shown.
+    """
+    if _VERBOSE or os.environ.get("GREENBOND_DEBUG"):
+        import traceback
+
+        console.print(traceback.format_exc())
+
+
+def _startup(verbose, config_path):
+    """Shared root setup: logging, the legacy-name notice, config checks."""
+    from .config import get_config, validate_config
+    from .logging_config import get_logger, setup_logging
+
+    global _VERBOSE
+    _VERBOSE = verbose
+    setup_logging(verbose)
+    logger = get_logger("greenbond.cli")
+    if _INVOKED_AS_GREENBOND:
+        _get_console().print(
+            "[yellow]Note: the 'greenbond' command name is deprecated; "
+            "use 'gbt' instead.[/yellow]"
+        )
+    config = get_config(config_path)
+    issues = validate_config(config)
+    for issue in issues:
+        logger.warning("Config issue: %s", issue)
+
+
+def _write_csv(df, path):
+    """Write *df* to CSV via pyarrow's C++ writer when it is installed.
+
+    Falls back to DataFrame.to_csv; output content is equivalent, and
+    pyarrow stays optional.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+
+
+def _require_file(path, console):
+    """Exit fast (code 2) when an input file is missing.
+
+    A single stat before any heavy work, instead of letting pandas or
+    geopandas raise deep inside the loader on a typoed path.
+    """
+    if not os.path.isfile(path):
+        console.print(console.err, f"{path} not found")
+        raise SystemExit(2)
+
+
+def _resolve_input(path, default):
+    """Resolve an input path once, identically for precheck and loader.
+
+    User-supplied paths are taken relative to the working directory;
+    config defaults resolve against the repo root exactly as the
+    loaders do. Both the existence check and the eventual load then
+    stat the same absolute path.
+    """
+    from .config import resolve_data_path
+
+    if path is None:
+        return resolve_data_path(default)
+    return Path(path).absolute()
+
+
+_MKDIR_CACHE = set()
+
+
+def _ensure_dir(path):
+    """``mkdir -p`` with a process-local cache of created directories.
+
+    Repeat output paths in one process (the all command, batch loops)
+    skip the ancestor stat walk mkdir performs even with exist_ok; on
+    NFS/SMB mounts those stats are not free.
+    """
+    if path in _MKDIR_CACHE:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _MKDIR_CACHE.add(path)
+
+
+def _validate_chunked(input_path, chunksize, columns, output, config, console, max_errors=1000):
+    """Validate the CSV ``chunksize`` rows at a time.
+
+    Keeps resident memory bounded by the chunk size: each chunk is
+    validated and (optionally) appended to the report CSV before the
+    next one is read. Chunks come through the same dtype/date pipeline
+    as the whole-file load, so both modes report identical findings,
+    and the row index runs continuously across chunks, so row numbers
+    in messages match the whole-file run.
+    """
+    from .data_loader import load_green_bonds_chunks
+    from .validation import ValidationResult, validate_bond_data_enhanced
+
+    usecols = (
+        [c.strip() for c in columns.split(",")]
+        if columns
+        else config.required_columns
+    )
+    # The validator checks the required columns on every chunk, so a
+    # --columns subset that omits one would fail on each chunk with the
+    # same message. Reject it once, up front, before reading the file.
+    if columns:
+        missing = [c for c in config.required_columns if c not in usecols]
+        if missing:
+            console.print(
+                console.err,
+                f"--columns must include the required columns; missing: {', '.join(missing)}",
+            )
+            raise SystemExit(2)
+    result = ValidationResult()
+    seen_ids = set()
+    n_rows = 0
+    if output:
+        _ensure_dir(output.parent)
+    for chunk in load_green_bonds_chunks(
+        input_path, chunksize, config=config, usecols=usecols
+    ):
+        part = validate_bond_data_enhanced(chunk, max_messages=max_errors)
+        # Duplicate bond_ids that straddle a chunk boundary are invisible
+        # to the per-chunk pass, so check against the ids seen so far.
+        if "bond_id" in chunk.columns:
+            for idx in chunk.index[chunk["bond_id"].isin(seen_ids)]:
+                part.warning_count += 1
+                if len(part.warnings) < max_errors:
+                    part.warnings.append(
+                        f"Row {idx}: duplicate bond_id {chunk.at[idx, 'bond_id']!r}"
+                    )
+                part.row_flags.setdefault(idx, []).append("duplicate bond_id")
+            seen_ids.update(chunk["bond_id"].dropna())
+        result.merge(part)
+        # merge() concatenates each chunk's capped lists; re-trim so the
+        # bound holds across the whole file, not per chunk.
+        del result.errors[max_errors:]
+        del result.warnings[max_errors:]
+        if output:
+            joined = {idx: " | ".join(flags) for idx, flags in part.row_flags.items()}
+            chunk.assign(
+                validation_flags=chunk.index.to_series().map(joined).fillna("OK")
+            ).to_csv(output, index=False, mode="w" if n_rows == 0 else "a", header=n_rows == 0)
+        n_rows += len(chunk)
+    console.print(
+        console.ok,
+        f"Validated {n_rows} records from {input_path} in chunks of {chunksize}",
+    )
+    if output:
+        console.print(f"Validation report written to {output}")
+    return result
+
+
+def validate(input_path=None, output=None, engine="pandas", columns=None, chunksize=None, max_errors=1000):
+    """Validate the bond CSV and report errors, warnings, and row flags."""
+    from .config import get_config
+    from .logging_config import get_logger, log_exception
+
+    logger = get_logger("greenbond.validate")
+    config = get_config()
+    console = _get_console()
+    try:
+        if input_path is None:
+            logger.debug("Using input path from config: %s", config.raw_data_path)
+        input_path = _resolve_input(input_path, config.raw_data_path)
+        _require_file(input_path, console)
+        if chunksize:
+            result = _validate_chunked(
+                input_path, chunksize, columns, output, config, console, max_errors
+            )
+        else:
+            # Deferred past the config/path checks: a bad config or typoed
+            # path exits before pandas is ever imported.
+            from ._loader_cache import load_bonds_cached
+            from .validation import validate_bond_data_enhanced
+
+            df = load_bonds_cached(input_path, engine=engine)
+            console.print(console.ok, f"Loaded {len(df)} records from {input_path}")
+            result = validate_bond_data_enhanced(df, max_messages=max_errors)
+
+        # One print per block: rich parses markup and flushes per call,
+        # so a single joined string beats 20 small writes.
+        n_err = result.error_count
+        n_warn = result.warning_count
+        if n_err:
+            lines = [f"\n[bold red]Errors ({n_err}):[/bold red]"]
+            lines.extend(
+                f"  [red]•[/red] {error}" for error in islice(result.errors, 20)
+            )
+            if n_err > 20:
+                lines.append(f"  ...and {n_err - 20} more")
+            console.print("\n".join(lines))
+        if n_warn:
+            lines = [f"\n[bold yellow]Warnings ({n_warn}):[/bold yellow]"]
+            lines.extend(
+                f"  [yellow]•[/yellow] {warning}"
+                for warning in islice(result.warnings, 20)
+            )
+            if n_warn > 20:
+                lines.append(f"  ...and {n_warn - 20} more")
+            console.print("\n".join(lines))
+
+        if output and not chunksize:
+            _ensure_dir(output.parent)
+            if not result.row_flags:
+                # Clean file: every row would read "OK", so skip building
+                # the flags column and write the frame as-is.
+                df.to_csv(output, index=False, chunksize=50_000)
+            else:
+                import numpy as np
+                import pandas as pd
+
+                joined = {
+                    idx: " | ".join(flags) for idx, flags in result.row_flags.items()
+                }
+                # A categorical keeps one small integer code per row
+                # instead of a Python string object; the distinct flag
+                # combinations are few (int8 is ample).
+                categories = ["OK"] + sorted(set(joined.values()))
+                cat_code = {c: i for i, c in enumerate(categories)}
+                codes = np.zeros(len(df), dtype=np.int8)
+                codes[df.index.get_indexer(list(joined))] = [
+                    cat_code[v] for v in joined.values()
+                ]
+                # assign() shares the existing column blocks instead of
+                # duplicating the whole frame like df.copy() did.
+                output_df = df.assign(
+                    validation_flags=pd.Categorical.from_codes(codes, categories)
+                )
+                output_df.to_csv(output, index=False, chunksize=50_000)
+            console.print(f"\nValidation report written to {output}")
+
+        if result.is_valid:
+            console.print("\n[bold green]Validation passed.[/bold green]")
+        else:
+            console.print("\n[bold red]Validation failed.[/bold red]")
+            raise SystemExit(1)
+    except SystemExit:
+        raise
+    except Exception as e:
+        log_exception(logger, e)
+        console.print(console.err, str(e))
+        _print_traceback(console)
+        raise SystemExit(1)
+
+
+def _summary_chunked(input_path, chunksize, config):
+    """Build the summary outputs ``chunksize`` rows at a time.
+
+    Streams the CSV through running partials — per-country/year/proceeds
+    sums, per-column non-null counts, unique-value sets, date extremes —
+    and finalizes the same ``(stats, summary_table, coverage_report)``
+    triple the whole-file path produces. Only the raw amount values are
+    retained across chunks (float32, four bytes per row) so the median
+    stays exact; everything else is O(groups), not O(rows).
+    """
+    import numpy as np
+    import pandas as pd
+
+    from .data_loader import load_green_bonds_chunks
+
+    def _accumulate(into, series):
+        for key, val in series.items():
+            into[key] = into.get(key, 0.0) + float(val)
+
+    n_rows = 0
+    columns = None
+    non_null = None
+    amount_parts = []
+    issuers = set()
+    country_sums = {}
+    year_sums = {}
+    proceeds_sums = {}
+    earliest = latest = None
+
+    for chunk in load_green_bonds_chunks(input_path, chunksize, config=config):
+        n_rows += len(chunk)
+        if columns is None:
+            columns = list(chunk.columns)
+        counts = chunk.notna().sum()
+        non_null = counts if non_null is None else non_null.add(counts, fill_value=0)
+        amount_parts.append(
+            chunk["amount_usd_millions"].to_numpy(dtype=np.float32, copy=True)
+        )
+        issuers.update(chunk["issuer"].dropna().unique())
+        _accumulate(
+            country_sums,
+            chunk.groupby("country_code", observed=True)["amount_usd_millions"].sum(),
+        )
+        if "year" in chunk.columns:
+            _accumulate(
+                year_sums,
+                chunk.groupby("year", observed=True)["amount_usd_millions"].sum(),
+            )
+        if "use_of_proceeds" in chunk.columns:
+            _accumulate(
+                proceeds_sums,
+                chunk.groupby("use_of_proceeds", observed=True)[
+                    "amount_usd_millions"
+                ].sum(),
+            )
+        if "issue_date" in chunk.columns:
+            dates = chunk["issue_date"].dropna()
+            if len(dates):
+                lo, hi = dates.min(), dates.max()
+                earliest = lo if earliest is None else min(earliest, lo)
+                latest = hi if latest is None else max(latest, hi)
+
+    amounts = (
+        np.concatenate(amount_parts)
+        if amount_parts
+        else np.array([], dtype=np.float32)
+    )
+    total = float(np.nansum(amounts, dtype=np.float64))
+    n_amounts = int(non_null["amount_usd_millions"]) if non_null is not None else 0
+    # Monetary values are rounded to the source data's 2 decimals at the
+    # output boundary, matching get_summary_statistics, so float32
+    # storage artifacts never reach the JSON.
+    stats = {
+        "total_bonds": n_rows,
+        "total_amount_usd_millions": round(total, 2),
+        "average_bond_size_usd_millions": round(total / n_amounts, 2) if n_amounts else float("nan"),
+        "median_bond_size_usd_millions": round(float(np.nanmedian(amounts)), 2) if n_amounts else float("nan"),
+        "unique_issuers": len(issuers),
+        "unique_countries": len(country_sums),
+    }
+    if earliest is not None:
+        stats["earliest_issue"] = earliest
+        stats["latest_issue"] = latest
+    top_5 = sorted(country_sums.items(), key=lambda kv: -kv[1])[:5]
+    stats["top_5_countries"] = {k: round(v, 2) for k, v in top_5}
+
+    metrics = [
+        "Total bonds",
+        "Total issuance (USD millions)",
+        "Countries covered",
+        "Unique issuers",
+    ]
+    values = [f"{n_rows:,}", f"{total:,.2f}", str(len(country_sums)), str(len(issuers))]
+    if earliest is not None:
+        metrics.append("Issue date range")
+        values.append(f"{earliest:%Y-%m-%d} to {latest:%Y-%m-%d}")
+    if country_sums:
+        sums = np.fromiter(country_sums.values(), dtype=np.float64)
+        labels = list(country_sums)
+        # Shares are rounded before the concentration math, matching
+        # analytics.metrics.portfolio_summary_table exactly.
+        shares = np.round(sums / total * 100.0, 2) if total else np.zeros_like(sums)
+        order = np.argsort(-sums)
+        metrics.append("Top 5 country share (%)")
+        values.append(f"{round(float(shares[order[:5]].sum()), 2):.2f}")
+        metrics.append("Country concentration (HHI)")
+        values.append(f"{round(float((shares ** 2).sum()), 2):.2f}")
+        metrics.append("Largest market")
+        values.append(str(labels[order[0]]))
+    if year_sums:
+        metrics.append("Peak issuance year")
+        values.append(str(int(max(year_sums, key=year_sums.get))))
+    if proceeds_sums:
+        metrics.append("Top project type")
+        values.append(str(max(proceeds_sums, key=proceeds_sums.get)))
+    summary_table = pd.DataFrame({"metric": metrics, "value": values})
+
+    if columns is None:
+        columns = []
+    counts_arr = (
+        non_null.reindex(columns).fillna(0).to_numpy(dtype=np.int64)
+        if non_null is not None
+        else np.zeros(len(columns), dtype=np.int64)
+    )
+    pct = counts_arr / n_rows * 100 if n_rows else np.zeros(len(columns))
+    coverage_report = pd.DataFrame(
+        {
+            "column_name": np.asarray(columns, dtype=object),
+            "non_null_count": counts_arr,
+            "pct_non_null": pct.round(2),
+            "coverage_note": np.where(
+                pct < 80, "⚠ Low coverage (<80%)", "✓ Good coverage"
+            ),
+        }
+    )
+    return stats, summary_table, coverage_report
+
+
+def summary(input_path=None, json_output=False, output_dir=None, engine="pandas", chunksize=None):
+    """Print portfolio statistics and write the summary/coverage CSVs."""
+    from .config import get_config
+    from .logging_config import get_logger, log_exception
+
+    logger = get_logger("greenbond.summary")
+    config = get_config()
+    # Machine-readable output: stay on the plain shim so rich is never
+    # imported (or ANSI-styled) for --json, even on a terminal.
+    console = _PlainConsole() if json_output else _get_console()
+    try:
+        if input_path is None:
+            logger.debug("Using input path from config: %s", config.raw_data_path)
+        input_path = _resolve_input(input_path, config.raw_data_path)
+        if output_dir is None:
+            output_dir = Path(config.outputs_dir)
+            logger.debug("Using output dir from config: %s", output_dir)
+        _require_file(input_path, console)
+        if chunksize:
+            stats, summary_table, coverage_report = _summary_chunked(
+                input_path, chunksize, config
+            )
+            logger.info(
+                "Summarized %d records in chunks of %d",
+                stats["total_bonds"],
+                chunksize,
+            )
+        else:
+            from ._loader_cache import load_bonds_cached
+            from .analytics.metrics import (
+                data_coverage_report,
+                portfolio_summary_table,
+            )
+            from .data_loader import get_summary_statistics
+
+            df = load_bonds_cached(input_path, engine=engine)
+            logger.info("Loaded %d records for summary", len(df))
+
+            stats = get_summary_statistics(df)
+            summary_table = portfolio_summary_table(df)
+            coverage_report = data_coverage_report(df)
+
+        # Kick the CSV writes off now: they are disk-bound, independent
+        # of the console output, and pandas/pyarrow release the GIL for
+        # most of the serialization, so the write latency hides behind
+        # the table rendering below.
+        from concurrent.futures import ThreadPoolExecutor
+
+        _ensure_dir(output_dir)
+        summary_path = output_dir / "portfolio_summary.csv"
+        coverage_path = output_dir / "data_coverage_report.csv"
+        io_pool = ThreadPoolExecutor(max_workers=2)
+        write_futures = [
+            io_pool.submit(_write_csv, summary_table, summary_path),
+            io_pool.submit(_write_csv, coverage_report, coverage_path),
+        ]
+
+        if json_output:
+            payload = {
+                "statistics": stats,
+                "portfolio_summary": summary_table.to_dict(orient="records"),
+                "data_coverage": coverage_report.to_dict(orient="records"),
+            }
+            # default=str covers the Timestamp values, so no copy or
+            # manual stringification of the date fields is needed.
+            try:
+                import orjson
+
+                rendered = orjson.dumps(
+                    payload,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    default=str,
+                ).decode()
+            except ImportError:
+                rendered = json.dumps(payload, indent=2, default=str)
+            sys.stdout.write(rendered)
+            sys.stdout.write("\n")
+        else:
+            fmt_usd = "${:,.2f}".format
+            stats_rows = [
+                ("Total Bonds", str(stats["total_bonds"])),
+                (
+                    "Total Amount (USD Millions)",
+                    fmt_usd(stats["total_amount_usd_millions"]),
+                ),
+                (
+                    "Average Bond Size (USD Millions)",
+                    fmt_usd(stats["average_bond_size_usd_millions"]),
+                ),
+                (
+                    "Median Bond Size (USD Millions)",
+                    fmt_usd(stats["median_bond_size_usd_millions"]),
+                ),
+                ("Unique Issuers", str(stats["unique_issuers"])),
+                ("Unique Countries", str(stats["unique_countries"])),
+            ]
+            if "earliest_issue" in stats:
+                stats_rows.append(
+                    (
+                        "Issue Date Range",
+                        f"{stats['earliest_issue']:%Y-%m-%d} to "
+                        f"{stats['latest_issue']:%Y-%m-%d}",
+                    )
+                )
+            if console.is_rich:
+                from rich.table import Table
+
+                stats_table = Table(title="Summary Statistics")
+                stats_table.add_column("Metric", style="cyan")
+                stats_table.add_column("Value", justify="right")
+                for metric, value in stats_rows:
+                    stats_table.add_row(metric, value)
+                console.print(stats_table)
+
+                table = Table(title="Portfolio Summary")
+                table.add_column("Metric", style="cyan")
+                table.add_column("Value", justify="right")
+                # zip over the raw arrays: iterrows() builds a Series per
+                # row just to read two fields from it.
+                for metric, value in zip(
+                    summary_table["metric"].to_numpy(),
+                    summary_table["value"].to_numpy(),
+                ):
+                    table.add_row(metric, value)
+                console.print(table)
+            else:
+                lines = ["Summary Statistics"]
+                lines.extend(f"{metric}\t{value}" for metric, value in stats_rows)
+                lines.append("\nPortfolio Summary")
+                lines.extend(
+                    f"{metric}\t{value}"
+                    for metric, value in zip(
+                        summary_table["metric"].to_numpy(),
+                        summary_table["value"].to_numpy(),
+                    )
+                )
+                console.print("\n".join(lines))
+
+            low_coverage = coverage_report.loc[
+                coverage_report["pct_non_null"] < 80,
+                ["column_name", "pct_non_null"],
+            ]
+            if not low_coverage.empty:
+                # Vectorized string build: one Series.str concatenation and
+                # a single print instead of a per-row format loop.
+                bullets = (
+                    "  • "
+                    + low_coverage["column_name"].astype(str)
+                    + ": "
+                    + low_coverage["pct_non_null"].map("{:.1f}%".format)
+                )
+                console.print(
+                    "\n[bold yellow]Low-coverage columns:[/bold yellow]\n"
+                    + "\n".join(bullets.tolist())
+                )
+
+        # Surface any write failure before claiming success.
+        for future in write_futures:
+            future.result()
+        io_pool.shutdown()
+        console.print(f"\nSummary saved to {summary_path}")
+        console.print(f"Coverage report saved to {coverage_path}")
+    except SystemExit:
+        raise
+    except Exception as e:
+        log_exception(logger, e)
+        console.print(console.err, str(e))
+        _print_traceback(console)
+        raise SystemExit(1)
+
+
+def _load_all(input_path, geo_path, engine="pandas", usecols=None):
+    """Load bonds and geometries and join them, returning all three frames.
+
+    The single load pipeline behind ``map``, ``viz``, and ``all``. Full
+    loads go through the process-level cache, so commands composed in
+    one interpreter parse each file once; a *usecols* subset bypasses
+    the cache (it would key a partial frame alongside the full loads).
+
+    The two loads are independent and both the pandas CSV tokenizer and
+    the GDAL/fiona readers release the GIL for most of their work, so
+    they run on separate threads: the load phase costs max(bonds, geo)
+    instead of their sum.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ._loader_cache import load_bonds_cached, load_geometries_cached
+    from .data_loader import join_bonds_with_geo, load_green_bonds
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        if usecols is not None:
+            bonds_future = pool.submit(load_green_bonds, input_path, usecols=usecols)
+        else:
+            bonds_future = pool.submit(load_bonds_cached, input_path, engine=engine)
+        geo_future = pool.submit(load_geometries_cached, geo_path)
+        bonds = bonds_future.result()
+        countries = geo_future.result()
+    geo_bonds = join_bonds_with_geo(bonds, countries)
+    return bonds, countries, geo_bonds
+
+
+def map_cmd(input_path=None, geo_path=None, output=None):
+    """Join bonds onto country geometries and export the ArcGIS-ready CSV."""
+    from .config import get_config
+    from .logging_config import get_logger, log_exception
+
+    logger = get_logger("greenbond.map")
+    config = get_config()
+    console = _get_console()
+    try:
+        if input_path is None:
+            logger.debug("Using input path from config: %s", config.raw_data_path)
+        if geo_path is None:
+            logger.debug("Using geo path from config: %s", config.geo_data_path)
+        input_path = _resolve_input(input_path, config.raw_data_path)
+        geo_path = _resolve_input(geo_path, config.geo_data_path)
+        if output is None:
+            output = Path(config.outputs_dir) / "map_data.csv"
+        _require_file(input_path, console)
+        _require_file(geo_path, console)
+        # The map join only touches these three columns; skip parsing
+        # the rest of the file.
+        bonds, countries, geo_bonds = _load_all(
+            input_path,
+            geo_path,
+            usecols=["bond_id", "country_code", "amount_usd_millions"],
+        )
+        console.print(
+            console.ok, f"Joined {len(bonds)} bonds onto {len(countries)} countries"
+        )
+
+        _ensure_dir(output.parent)
+        geo_bonds.drop(columns="geometry").to_csv(output, index=False)
+        console.print(f"Map data written to {output}")
+    except SystemExit:
+        raise
+    except Exception as e:
+        log_exception(logger, e)
+        console.print(console.err, str(e))
+        _print_traceback(console)
+        raise SystemExit(1)
+
+
+def viz(input_path=None, geo_path=None, output_dir=None, interactive=False, engine="pandas"):
+    """Render the static charts (and optionally the interactive map)."""
+    from .config import get_config
+    from .logging_config import get_logger, log_exception
+
+    logger = get_logger("greenbond.viz")
+    config = get_config()
+    console = _get_console()
+    try:
+        input_path = _resolve_input(input_path, config.raw_data_path)
+        geo_path = _resolve_input(geo_path, config.geo_data_path)
+        if output_dir is None:
+            output_dir = Path(config.outputs_dir) / "visuals"
+        _require_file(input_path, console)
+        _require_file(geo_path, console)
+        _ensure_dir(output_dir)
+        from .visuals import create_and_save_all_visuals
+
+        bonds, countries, geo_bonds = _load_all(input_path, geo_path, engine=engine)
+
+        # Aggregate from the bonds side, not from geo_bonds: countries
+        # whose code misses the iso_a3 merge (real GeoJSONs drop codes,
+        # e.g. Natural Earth's -99 for FRA/NOR) have no post-merge row,
+        # and deriving the chart from the joined frame silently loses
+        # their issuance. The groupby runs on categorical codes.
+        country_totals = bonds.groupby("country_code", observed=True)[
+            "amount_usd_millions"
+        ].sum()
+        saved_files = create_and_save_all_visuals(
+            bonds, geo_bonds, str(output_dir), country_totals=country_totals
+        )
+        for name, path in saved_files.items():
+            console.print(console.ok, f"{name}: {path}")
+
+        if interactive:
+            # Probe for folium before importing anything: find_spec only
+            # searches sys.path, so the missing-dependency path skips the
+            # import machinery (and its traceback) entirely.
+            import importlib.util
+
+            if importlib.util.find_spec("folium") is None:
+                console.print(
+                    "[yellow]folium is not installed; skipping the interactive "
+                    "map (pip install folium).[/yellow]"
+                )
+            else:
+                from .interactive import create_interactive_choropleth_map
+
+                html_path = output_dir / "interactive_map.html"
+                create_interactive_choropleth_map(geo_bonds, html_path)
+                console.print(console.ok, f"interactive map: {html_path}")
+    except SystemExit:
+        raise
+    except Exception as e:
+        log_exception(logger, e)
+        console.print(console.err, str(e))
+        _print_traceback(console)
+        raise SystemExit(1)
+
+
+def all_cmd(input_path=None, geo_path=None, output_dir=None, interactive=False, engine="pandas"):
+    """Run validation, summary, map export, and visuals on a single load."""
+    from .config import get_config
+    from .logging_config import get_logger, log_exception
+
+    logger = get_logger("greenbond.all")
+    config = get_config()
+    console = _get_console()
+    try:
+        input_path = _resolve_input(input_path, config.raw_data_path)
+        geo_path = _resolve_input(geo_path, config.geo_data_path)
+        if output_dir is None:
+            output_dir = Path(config.outputs_dir)
+        _require_file(input_path, console)
+        _require_file(geo_path, console)
+
+        bonds, countries, geo_bonds = _load_all(input_path, geo_path, engine=engine)
+        console.print(
+            console.ok,
+            f"Loaded {len(bonds)} bonds and {len(countries)} countries",
+        )
+
+        from .validation import validate_bond_data_enhanced
+
+        result = validate_bond_data_enhanced(bonds)
+        if result.is_valid:
+            console.print(console.ok, "Validation passed")
+        else:
+            console.print(
+                f"[bold red]Validation found {result.error_count} errors and "
+                f"{result.warning_count} warnings[/bold red] "
+                "(run 'gbt validate' for detail)"
+            )
+
+        # The remaining stages run the regular commands in-process: the
+        # loads above are memoized on the file's stat signature, so each
+        # stage reuses the parsed frames instead of re-reading the CSV
+        # and GeoJSON.
+        summary(input_path=input_path, output_dir=output_dir, engine=engine)
+
+        map_path = output_dir / "map_data.csv"
+        geo_bonds.drop(columns="geometry").to_csv(map_path, index=False)
+        console.print(f"Map data written to {map_path}")
+
+        viz(
+            input_path=input_path,
+            geo_path=geo_path,
+            output_dir=output_dir / "visuals",
+            interactive=interactive,
+            engine=engine,
+        )
+        if not result.is_valid:
+            raise SystemExit(1)
+    except SystemExit:
+        raise
+    except Exception as e:
+        log_exception(logger, e)
+        console.print(console.err, str(e))
+        _print_traceback(console)
+        raise SystemExit(1)
+
+
+def version():
+    """Show the toolkit version."""
+    from . import __version__
+
+    console = _get_console()
+    console.print("Green Bond Tracker")
+    console.print(f"version {__version__}")
+    console.print("https://github.com/gabrielpriante/green-bond-tracker-project")
+
+
+_ENGINE_HELP = "CSV reader: pandas, pyarrow, or polars."
+
+
+def _add_validate_parser(sub):
+    p = sub.add_parser(
+        "validate",
+        help="Validate the bond CSV and report errors, warnings, and row flags.",
+    )
+    p.add_argument("--input", "-i", dest="input_path", type=Path, help="Bond CSV to validate.")
+    p.add_argument("--output", "-o", type=Path, help="Write a per-row validation report CSV here.")
+    p.add_argument("--engine", default="pandas", help=_ENGINE_HELP)
+    p.add_argument("--columns", help="Comma-separated columns to load (chunked mode; default: required).")
+    p.add_argument("--chunksize", type=int, help="Validate the CSV this many rows at a time instead of loading it whole.")
+    p.add_argument("--max-errors", type=int, default=1000, help="Keep at most this many error/warning messages (counts stay exact).")
+
+
+def _add_summary_parser(sub):
+    p = sub.add_parser(
+        "summary",
+        help="Print portfolio statistics and write the summary/coverage CSVs.",
+    )
+    p.add_argument("--input", "-i", dest="input_path", type=Path)
+    p.add_argument("--json", dest="json_output", action="store_true", help="Emit JSON to stdout.")
+    p.add_argument("--output-dir", type=Path, help="Directory for the summary CSVs.")
+    p.add_argument("--engine", default="pandas", help=_ENGINE_HELP)
+    p.add_argument("--chunksize", type=int, help="Aggregate the CSV this many rows at a time instead of loading it whole.")
+
+
+def _add_map_parser(sub):
+    p = sub.add_parser(
+        "map",
+        help="Join bonds onto country geometries and export the ArcGIS-ready CSV.",
+    )
+    p.add_argument("--input", "-i", dest="input_path", type=Path)
+    p.add_argument("--geo", "-g", dest="geo_path", type=Path)
+    p.add_argument("--output", "-o", type=Path, help="Destination CSV for the joined map data.")
+
+
+def _add_viz_parser(sub):
+    p = sub.add_parser(
+        "viz",
+        help="Render the static charts (and optionally the interactive map).",
+    )
+    p.add_argument("--input", "-i", dest="input_path", type=Path)
+    p.add_argument("--geo", "-g", dest="geo_path", type=Path)
+    p.add_argument("--output-dir", type=Path)
+    p.add_argument("--interactive", action="store_true", help="Also build the folium HTML map.")
+    p.add_argument("--engine", default="pandas", help=_ENGINE_HELP)
+
+
+def _add_all_parser(sub):
+    p = sub.add_parser(
+        "all",
+        help="Run validation, summary, map export, and visuals on a single load.",
+    )
+    p.add_argument("--input", "-i", dest="input_path", type=Path)
+    p.add_argument("--geo", "-g", dest="geo_path", type=Path)
+    p.add_argument("--output-dir", type=Path, help="Directory for every generated output.")
+    p.add_argument("--interactive", action="store_true", help="Also build the folium HTML map.")
+    p.add_argument("--engine", default="pandas", help=_ENGINE_HELP)
+
+
+def _add_version_parser(sub):
+    sub.add_parser("version", help="Show the toolkit version.")
+
+
+_COMMANDS = {
+    "validate": (validate, _add_validate_parser),
+    "summary": (summary, _add_summary_parser),
+    "map": (map_cmd, _add_map_parser),
+    "viz": (viz, _add_viz_parser),
+    "all": (all_cmd, _add_all_parser),
+    "version": (version, _add_version_parser),
+}
+
+
+def _sniff_subcommand(argv):
+    """Return the first argv token naming a known command, else None."""
+    for token in argv:
+        if not token.startswith("-") and token in _COMMANDS:
+            return token
+    return None
+
+
+def _build_parser(command=None):
+    """Build the argparse parser, with only *command*'s subparser when known.
+
+    argparse replaces the earlier typer app: no click callback chain and
+    no decorator introspection on startup, which is most of a scripted
+    invocation's fixed cost. When argv names a single known command only
+    that subparser is constructed; root --help builds all of them.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="gbt",
+        description="Load, validate, and summarize the Global Green Bond Tracker data.",
+    )
+    parser.add_argument(
+        "-v", "--version", action="store_true", help="Show the toolkit version and exit."
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable debug logging.")
+    parser.add_argument(
+        "--config", dest="config_path", type=Path, help="Alternate config.yaml location."
+    )
+    sub = parser.add_subparsers(dest="command", metavar="COMMAND")
+    for name in ([command] if command is not None else _COMMANDS):
+        _COMMANDS[name][1](sub)
+    return parser
+
+
+def run(argv=None):
+    """Parse arguments and dispatch to the selected command."""
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _build_parser(_sniff_subcommand(argv))
+    args = vars(parser.parse_args(argv))
+    if args.pop("version"):
+        from . import __version__
+
+        print(f"Green Bond Tracker v{__version__}")
+        return
+    command = args.pop("command")
+    verbose = args.pop("verbose")
+    config_path = args.pop("config_path")
+    if command is None:
+        parser.print_help()
+        return
+    _startup(verbose, config_path)
+    _COMMANDS[command][0](**args)
+
+
+if __name__ == "__main__":
+    run()
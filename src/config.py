@@ -0,0 +1,239 @@
+"""Configuration handling for the green bond toolkit.
+
+Settings live in an optional ``config.yaml`` at the repository root.
+Anything not specified there falls back to :data:`DEFAULT_CONFIG`, which
+matches the layout documented in the README.
+"""
+
+import warnings
+from functools import cached_property, lru_cache
+from pathlib import Path
+
+import yaml
+
+try:
+    # libyaml tokenizes in C and is several times faster than the pure-
+    # Python loader yaml.safe_load falls back to on most installs.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Sentinel distinguishing "key absent" from a legitimate None value, so
+# absent keys can be cached without re-walking on every call.
+_MISSING = object()
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def resolve_data_path(path):
+    """Resolve a possibly-relative data path against the repository root.
+
+    Config defaults are repo-root-relative so they work from any working
+    directory; absolute paths pass through untouched. Lives here rather
+    than in the data loaders so the CLI can resolve paths for its
+    existence prechecks without importing pandas.
+    """
+    path = Path(path)
+    if not path.is_absolute():
+        path = _REPO_ROOT / path
+    return path
+
+
+@lru_cache(maxsize=256)
+def _split_key(key):
+    """Split a dotted key once; the tuple is shared across instances."""
+    return tuple(key.split("."))
+
+DEFAULT_CONFIG = {
+    "paths": {
+        "raw_data": "data/raw/green_bonds.csv",
+        "geo_data": "data/geo/countries.geojson",
+        "outputs": "outputs",
+    },
+    "columns": {
+        "required": ["bond_id", "issuer", "country_code", "amount_usd_millions"],
+        "optional": ["issue_date", "use_of_proceeds", "currency", "certification"],
+    },
+    "dtypes": {
+        "bond_id": "string",
+        "issuer": "category",
+        "country_code": "category",
+        "amount_usd_millions": "float",
+        "issue_date": "date",
+        "use_of_proceeds": "category",
+        "currency": "category",
+        "certification": "category",
+    },
+    "analytics": {
+        "top_n": 5,
+        "low_coverage_threshold": 80.0,
+    },
+    "map": {
+        "min_year": 2006,
+        "max_year": 2024,
+    },
+}
+
+
+class Config:
+    """Read-only view over a parsed configuration dictionary.
+
+    The derived properties are ``cached_property``: the dict walks run
+    once per instance, and repeated accessor calls on the hot CLI path
+    are plain attribute reads.
+    """
+
+    def __init__(self, config_dict):
+        self._config = config_dict or {}
+        self._value_cache = {}
+
+    def get(self, key, default=None):
+        """Look up a dotted key like ``"paths.raw_data"``.
+
+        Resolved leaves (including absences) are cached per instance, so
+        a hot key costs one dict probe instead of a split and walk. An
+        explicitly configured ``None`` is returned as-is rather than
+        masked by *default*.
+        """
+        value = self._value_cache.get(key, _MISSING)
+        if value is _MISSING and key not in self._value_cache:
+            value = self._config
+            for part in _split_key(key):
+                if not isinstance(value, dict):
+                    value = _MISSING
+                    break
+                value = value.get(part, _MISSING)
+                if value is _MISSING:
+                    break
+            self._value_cache[key] = value
+        return default if value is _MISSING else value
+
+    @cached_property
+    def raw_data_path(self):
+        return self.get("paths.raw_data", DEFAULT_CONFIG["paths"]["raw_data"])
+
+    @cached_property
+    def geo_data_path(self):
+        return self.get("paths.geo_data", DEFAULT_CONFIG["paths"]["geo_data"])
+
+    @cached_property
+    def outputs_dir(self):
+        return self.get("paths.outputs", DEFAULT_CONFIG["paths"]["outputs"])
+
+    @cached_property
+    def required_columns(self):
+        return list(self.get("columns.required", DEFAULT_CONFIG["columns"]["required"]))
+
+    @cached_property
+    def optional_columns(self):
+        return list(self.get("columns.optional", DEFAULT_CONFIG["columns"]["optional"]))
+
+    @cached_property
+    def all_columns(self):
+        return self.required_columns + self.optional_columns
+
+    @cached_property
+    def dtypes(self):
+        return dict(self.get("dtypes", DEFAULT_CONFIG["dtypes"]))
+
+    def _invalidate(self):
+        """Drop the cached accessor values.
+
+        Only needed when ``_config`` is mutated after construction,
+        which tests occasionally do; normal code treats Config as
+        read-only and never calls this.
+        """
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
+        self._value_cache.clear()
+
+
+_config_instance = None
+
+# Parsed configs keyed by (resolved path, mtime_ns, size): repeated
+# load_config calls on an unchanged file (tests, notebooks) skip the
+# YAML parse, while an edited file is a miss, never a stale hit.
+_parsed_cache = {}
+
+
+def load_config(config_path=None):
+    """Parse ``config.yaml`` (or a supplied path) into a :class:`Config`."""
+    if config_path is None:
+        config_path = Path(__file__).resolve().parent.parent / "config.yaml"
+    config_path = Path(config_path)
+    if config_path.exists():
+        st = config_path.stat()
+        cache_key = (str(config_path), st.st_mtime_ns, st.st_size)
+        cached = _parsed_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        # Bytes in, so the UTF-8 decode happens inside the parser rather
+        # than as a separate Python-level pass.
+        with open(config_path, "rb") as f:
+            config_dict = yaml.load(f, Loader=_YamlLoader) or {}
+        # Warn here, once per parse, rather than inside the path
+        # accessors: the getters stay pure lookups and the warning fires
+        # whether or not a path is ever read.
+        if "paths" not in config_dict:
+            warnings.warn(
+                "No 'paths' section in config; using default data paths",
+                stacklevel=2,
+            )
+        config = Config(config_dict)
+        _parsed_cache[cache_key] = config
+        return config
+    return Config(dict(DEFAULT_CONFIG))
+
+
+def get_config(config_path=None):
+    """Return the process-wide :class:`Config`, loading it on first use."""
+    global _config_instance
+    if _config_instance is None:
+        _config_instance = load_config(config_path)
+    return _config_instance
+
+
+def reset_config():
+    """Drop the cached configuration (mainly for tests)."""
+    global _config_instance
+    _config_instance = None
+    _parsed_cache.clear()
+
+
+def validate_config(config):
+    """Sanity-check a :class:`Config`, returning a list of issue strings.
+
+    Checks run cheapest-and-most-structural first: with no required
+    columns the config is unusable, so the dtype cross-check (and its
+    accessor warnings) is skipped entirely. The analytics and map range
+    checks only run when the section is actually present — an absent
+    section means the built-in defaults, which are always valid.
+    """
+    required = config.required_columns
+    if not required:
+        return ["columns.required is empty"]
+    issues = []
+    dtypes = config.dtypes
+    for col in required:
+        if col not in dtypes:
+            issues.append(f"Required column '{col}' has no dtype entry")
+    if "analytics" in config._config:
+        top_n = config.get("analytics.top_n", 5)
+        if not isinstance(top_n, int) or top_n < 1:
+            issues.append(f"analytics.top_n must be a positive integer, got {top_n!r}")
+        threshold = config.get("analytics.low_coverage_threshold", 80.0)
+        if not isinstance(threshold, (int, float)) or not 0 <= threshold <= 100:
+            issues.append(
+                f"analytics.low_coverage_threshold must be between 0 and 100, got {threshold!r}"
+            )
+    if "map" in config._config:
+        min_year = config.get("map.min_year", 2006)
+        max_year = config.get("map.max_year", 2024)
+        if not isinstance(min_year, int) or not isinstance(max_year, int):
+            issues.append("map.min_year and map.max_year must be integers")
+        elif min_year > max_year:
+            issues.append(
+                f"map.min_year ({min_year}) is after map.max_year ({max_year})"
+            )
+    return issues
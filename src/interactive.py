@@ -0,0 +1,23 @@
+"""Interactive folium map mirroring the hosted ArcGIS layer."""
+
+from pathlib import Path
+
+import folium
+
+
+def create_interactive_choropleth_map(geo_bonds, output_path):
+    """Build a leaflet choropleth of issuance and save it as HTML."""
+    m = folium.Map(location=[20, 0], zoom_start=2, tiles="cartodbpositron")
+    folium.Choropleth(
+        geo_data=geo_bonds.to_json(),
+        data=geo_bonds,
+        columns=["iso_a3", "total_amount_usd_millions"],
+        key_on="feature.properties.iso_a3",
+        fill_color="Greens",
+        nan_fill_color="#eeeeee",
+        legend_name="Green bond issuance (USD millions)",
+    ).add_to(m)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    m.save(str(output_path))
+    return str(output_path)
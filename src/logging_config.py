@@ -0,0 +1,22 @@
+"""Shared logging setup for the CLI and library modules."""
+
+import logging
+import sys
+
+_LOG_FORMAT = "%(asctime)s %(name)s %(levelname)s: %(message)s"
+
+
+def setup_logging(verbose=False):
+    """Configure root logging; DEBUG when *verbose*, INFO otherwise."""
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(level=level, format=_LOG_FORMAT, stream=sys.stderr)
+
+
+def get_logger(name):
+    """Return a namespaced logger (``greenbond.<component>`` by convention)."""
+    return logging.getLogger(name)
+
+
+def log_exception(logger, exc):
+    """Record an exception in a single structured line."""
+    logger.error("%s: %s", type(exc).__name__, exc)
@@ -0,0 +1,114 @@
+"""Static matplotlib/geopandas visuals for the tracker datasets."""
+
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+
+def create_bar_chart(bonds_df, geo_bonds, output_dir, country_totals=None):
+    """Horizontal bar chart of the top 15 issuing countries.
+
+    ``country_totals`` accepts a precomputed per-country issuance Series
+    so callers that already aggregated (e.g. for the choropleth join)
+    can skip the groupby here.
+    """
+    if country_totals is None:
+        country_totals = bonds_df.groupby("country_code", observed=True)[
+            "amount_usd_millions"
+        ].sum()
+    top = country_totals.nlargest(15).sort_values()
+    fig, ax = plt.subplots(figsize=(10, 8))
+    top.plot.barh(ax=ax, color="#2a7d4f")
+    ax.set_xlabel("Cumulative issuance (USD millions)")
+    ax.set_title("Top issuing countries")
+    out = Path(output_dir) / "top_countries_bar.png"
+    fig.tight_layout()
+    fig.savefig(out, dpi=150)
+    plt.close(fig)
+    return str(out)
+
+
+def create_amount_choropleth(bonds_df, geo_bonds, output_dir):
+    """World choropleth shaded by total issuance per country."""
+    fig, ax = plt.subplots(figsize=(14, 8))
+    geo_bonds.plot(
+        column="total_amount_usd_millions",
+        cmap="Greens",
+        legend=True,
+        ax=ax,
+        missing_kwds={"color": "#eeeeee"},
+    )
+    ax.set_axis_off()
+    ax.set_title("Green bond issuance (USD millions)")
+    out = Path(output_dir) / "issuance_choropleth.png"
+    fig.tight_layout()
+    fig.savefig(out, dpi=150)
+    plt.close(fig)
+    return str(out)
+
+
+def create_count_choropleth(bonds_df, geo_bonds, output_dir):
+    """World choropleth shaded by number of bonds per country."""
+    fig, ax = plt.subplots(figsize=(14, 8))
+    geo_bonds.plot(
+        column="bond_count",
+        cmap="YlGn",
+        legend=True,
+        ax=ax,
+        missing_kwds={"color": "#eeeeee"},
+    )
+    ax.set_axis_off()
+    ax.set_title("Number of green bonds issued")
+    out = Path(output_dir) / "bond_count_choropleth.png"
+    fig.tight_layout()
+    fig.savefig(out, dpi=150)
+    plt.close(fig)
+    return str(out)
+
+
+def create_and_save_all_visuals(
+    bonds_df, geo_bonds, output_dir, country_totals=None, parallel=True
+):
+    """Render every static visual, returning ``{name: saved path}``.
+
+    ``country_totals`` is threaded through to :func:`create_bar_chart`;
+    the choropleths read their columns straight off ``geo_bonds``.
+
+    The three figures are independent and CPU-bound, so by default each
+    renders in its own worker process; pass ``parallel=False`` (or run
+    where process pools are unavailable) for the sequential path.
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    if parallel:
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            with ProcessPoolExecutor(max_workers=3) as pool:
+                futures = {
+                    "bar_chart": pool.submit(
+                        create_bar_chart,
+                        bonds_df,
+                        geo_bonds,
+                        output_dir,
+                        country_totals,
+                    ),
+                    "amount_choropleth": pool.submit(
+                        create_amount_choropleth, bonds_df, geo_bonds, output_dir
+                    ),
+                    "count_choropleth": pool.submit(
+                        create_count_choropleth, bonds_df, geo_bonds, output_dir
+                    ),
+                }
+                return {name: future.result() for name, future in futures.items()}
+        except OSError:
+            pass  # sandboxed environments without fork/spawn
+    saved = {}
+    saved["bar_chart"] = create_bar_chart(
+        bonds_df, geo_bonds, output_dir, country_totals=country_totals
+    )
+    saved["amount_choropleth"] = create_amount_choropleth(bonds_df, geo_bonds, output_dir)
+    saved["count_choropleth"] = create_count_choropleth(bonds_df, geo_bonds, output_dir)
+    return saved